@@ -2,11 +2,15 @@
 
 from ... import ODEModel, Derivative, latex
 from ...core.fit import TakesData
-from ...core.support import keywordonly, key2str, deprecated
+from ...core.support import (
+    keywordonly, key2str, deprecated, cached_property, partial
+)
 
+from collections import OrderedDict
 import itertools
 
 import matplotlib.pyplot as plt
+from matplotlib.container import Container
 import numpy as np
 from scipy.stats import gaussian_kde
 
@@ -16,6 +20,18 @@ plt.ioff()
 class InteractiveGuess(TakesData):
     """A class that provides an graphical, interactive way of guessing initial
     fitting parameters."""
+    # Maximum number of model evaluations to remember. Every entry holds the
+    # model evaluated on the full plotting grid, so keep this modest.
+    _eval_cache_size = 32
+    # Maximum total size in bytes of the remembered evaluations. With several
+    # independent variables the grid grows quickly, so this is what limits
+    # the cache in practice. Evaluations larger than this are not remembered.
+    _eval_cache_max_nbytes = 64 * 2**20
+    # Number of steps the range of every slider is divided into. Dragging a
+    # slider then only visits a limited set of positions, which makes it
+    # likely to revisit ones that are still in the evaluation cache. See
+    # _quantize_slider_value.
+    _slider_steps = 256
 
     @keywordonly(n_points=50, log_contour=True, percentile=(5, 95))
     def __init__(self, *args, **kwargs):
@@ -51,6 +67,8 @@ class InteractiveGuess(TakesData):
         n_points = kwargs.pop('n_points')
         self.percentile = kwargs.pop('percentile')
         super(InteractiveGuess, self).__init__(*args, **kwargs)
+        self._eval_cache = OrderedDict()
+        self._eval_cache_nbytes = 0
         if len(self.independent_data) > 1:
             self._dimension_strategy = StrategynD(self)
         else:
@@ -59,6 +77,12 @@ class InteractiveGuess(TakesData):
         # be moved.
         self._projections = list(itertools.product(self.model.independent_vars,
                                                    self.model.dependent_vars))
+        # Position in the output of the model of the component plotted in
+        # every projection, such that redrawing can index the output directly
+        # instead of looking every component up by name.
+        components = list(self.model)
+        self._projection_indices = [components.index(y)
+                                    for _, y in self._projections]
         x_mins = {v: np.min(data) for v, data in self.independent_data.items()}
         x_maxs = {v: np.max(data) for v, data in self.independent_data.items()}
 
@@ -78,6 +102,12 @@ class InteractiveGuess(TakesData):
                                  for v in self.independent_data))
         self._x_grid = {v: meshgrid[idx].flatten()
                         for idx, v in enumerate(self.independent_data)}
+        # The keyword arguments to self.model. The grid never changes, so
+        # only the parameter values have to be filled in by _eval_model.
+        self._model_kwargs = key2str(self._x_grid)
+        self._model_kwargs.update(
+            (param.name, param.value) for param in self.model.params
+        )
 
         # Stretch the plot 20% in the Y direction, since that is visually more
         # appealing
@@ -93,6 +123,7 @@ class InteractiveGuess(TakesData):
 
         self._set_up_figure(x_mins, x_maxs, y_mins, y_maxs)
         self._set_up_sliders()
+        self._set_up_blitting()
         self._update_plot(None)
 
     @keywordonly(show=True, block=True)
@@ -133,8 +164,10 @@ class InteractiveGuess(TakesData):
         # Make all the subplots: set the x and y limits, scatter the data, and
         # plot the putative function.
         self._plots = {}
+        evaluated_model = self._eval_model()
 
-        for plotnr, proj in enumerate(self._projections, 1):
+        for plotnr, (proj, idx) in enumerate(zip(self._projections,
+                                                 self._projection_indices), 1):
             x, y = proj
             if Derivative(y, x) in self.model:
                 title_format = '$\\frac{{\\partial {dependant}}}{{\\partial {independant}}} = {expression}$'
@@ -152,7 +185,7 @@ class InteractiveGuess(TakesData):
             ax.set_xlabel('${}$'.format(x))
             ax.set_ylabel('${}$'.format(y))
             self._plot_data(proj, ax)
-            plot = self._plot_model(proj, ax)
+            plot = self._plot_model(proj, ax, evaluated_model[idx])
             self._plots[proj] = plot
 
     def _set_up_sliders(self):
@@ -178,45 +211,158 @@ class InteractiveGuess(TakesData):
                 maximum = 2 * val
             else:
                 maximum = param.max
-
             slid = plt.Slider(ax, param, minimum, maximum,
                               valinit=val, valfmt='% 5.4g')
             self._sliders[param] = slid
-            slid.on_changed(self._update_plot)
+            slid.on_changed(partial(self._slider_changed, param=param))
             i += 0.05
 
+    def _set_up_blitting(self):
+        """
+        If the canvas supports it, only the proposed model and the sliders
+        are redrawn on a slider event, instead of the entire figure. To this
+        end they are drawn as animated artists on top of a background, which
+        is stored whenever the full figure is drawn.
+        """
+        self._background = None
+        # Other canvases are swapped in temporarily when saving the figure,
+        # so remember which one is used for display.
+        self._blit_canvas = self.fig.canvas
+        self._blit = getattr(self._blit_canvas, 'supports_blit', False)
+        if not self._blit:
+            return
+        self._animated_artists = []
+        for plot in self._plots.values():
+            # Plots are either a single artist or a container of artists.
+            if isinstance(plot, Container):
+                self._animated_artists.extend(plot.get_children())
+            else:
+                self._animated_artists.append(plot)
+        for slider in self._sliders.values():
+            # Sliders are redrawn by self._redraw
+            slider.drawon = False
+            self._animated_artists.append(slider.ax)
+        for artist in self._animated_artists:
+            artist.set_animated(True)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """
+        Callback for full draws of the figure. Stores the background and draws
+        the animated artists on top of it.
+        """
+        # Saving the figure draws it at the dpi of the saved file, so only
+        # store the background of draws on the screen.
+        canvas = event.canvas
+        if canvas is self._blit_canvas and not canvas.is_saving():
+            self._background = event.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists:
+            artist.draw(event.renderer)
+
+    def _redraw(self):
+        """
+        Redraw the figure after a slider was moved. When possible, only the
+        proposed model and the sliders are redrawn.
+        """
+        canvas = self.fig.canvas
+        if not self._blit:
+            # The slider itself already asked for a redraw
+            return
+        elif self._background is None:
+            # The figure has not been drawn yet, so there is nothing to blit
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        for artist in self._animated_artists:
+            self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+
     def _plot_data(self, proj, ax):
         """Defers plotting the data to self._dimension_strategy"""
         return self._dimension_strategy.plot_data(proj, ax)
 
-    def _plot_model(self, proj, ax):
+    def _plot_model(self, proj, ax, y_vals):
         """Defers plotting the proposed model to self._dimension_strategy"""
-        return self._dimension_strategy.plot_model(proj, ax)
+        return self._dimension_strategy.plot_model(proj, ax, y_vals)
 
-    def _update_specific_plot(self, indep_var, dep_var):
+    def _update_specific_plot(self, indep_var, dep_var, y_vals):
         """Defers updating the proposed model to self._dimension_strategy"""
-        return self._dimension_strategy.update_plot(indep_var, dep_var)
+        return self._dimension_strategy.update_plot(indep_var, dep_var, y_vals)
+
+    def _slider_changed(self, val, param):
+        """
+        Callback for the slider belonging to ``param``. Updates the value of
+        only that parameter, and redraws the plot.
+        """
+        slider = self._sliders[param]
+        if slider.drag_active:
+            val = self._quantize_slider_value(slider, val)
+            # Show the quantized value, without triggering this callback again.
+            slider.eventson = False
+            try:
+                slider.set_val(val)
+            finally:
+                slider.eventson = True
+        param.value = val
+        self._update_plot(None)
+        self._redraw()
+
+    def _quantize_slider_value(self, slider, val):
+        """
+        Round a value of a slider that is being dragged to the nearest of
+        ``_slider_steps`` steps in its range. The steps are counted from the
+        initial value of the slider, such that the initial guess can always
+        be returned to exactly.
+
+        :param slider: The slider being dragged.
+        :param val: The value of the slider.
+        :return: The quantized value, within the range of the slider.
+        """
+        if slider.valmax <= slider.valmin:
+            return val
+        step = (slider.valmax - slider.valmin) / self._slider_steps
+        val = slider.valinit + round((val - slider.valinit) / step) * step
+        return min(max(val, slider.valmin), slider.valmax)
 
     def _update_plot(self, _):
-        """Callback to redraw the plot to reflect the new parameter values."""
-        # Since all sliders call this same callback without saying who they are
-        # I need to update the values for all parameters. This can be
-        # circumvented by creating a seperate callback function for each
-        # parameter.
-        for param in self.model.params:
-            param.value = self._sliders[param].val
-        for indep_var, dep_var in self._projections:
-            self._update_specific_plot(indep_var, dep_var)
+        """Redraw the plot to reflect the new parameter values."""
+        # The model is evaluated on the entire grid in one go, so there is no
+        # need to evaluate it again for every projection.
+        evaluated_model = self._eval_model()
+        for (indep_var, dep_var), idx in zip(self._projections,
+                                             self._projection_indices):
+            self._update_specific_plot(indep_var, dep_var, evaluated_model[idx])
 
     def _eval_model(self):
         """
-        Convenience method for evaluating the model with the current parameters
+        Convenience method for evaluating the model with the current parameters.
+        The most recent evaluations are remembered, such that moving a slider
+        back to a previous position does not evaluate the model again.
 
         :return: named tuple with results
         """
-        arguments = self._x_grid.copy()
-        arguments.update({param: param.value for param in self.model.params})
-        return self.model(**key2str(arguments))
+        key = tuple(param.value for param in self.model.params)
+        try:
+            # Pop and reinsert to mark this entry as the most recently used.
+            evaluated_model, nbytes = self._eval_cache.pop(key)
+        except KeyError:
+            for param, value in zip(self.model.params, key):
+                self._model_kwargs[param.name] = value
+            evaluated_model = self.model(**self._model_kwargs)
+            nbytes = sum(np.asarray(component).nbytes
+                         for component in evaluated_model)
+            if nbytes > self._eval_cache_max_nbytes:
+                return evaluated_model
+            # Make room for the new entry by forgetting the oldest ones.
+            while self._eval_cache and (
+                len(self._eval_cache) >= self._eval_cache_size or
+                self._eval_cache_nbytes + nbytes > self._eval_cache_max_nbytes
+            ):
+                _, (_, old_nbytes) = self._eval_cache.popitem(last=False)
+                self._eval_cache_nbytes -= old_nbytes
+            self._eval_cache_nbytes += nbytes
+        self._eval_cache[key] = (evaluated_model, nbytes)
+        return evaluated_model
 
     def __str__(self):
         """
@@ -246,23 +392,26 @@ class Strategy2D:
         ax.scatter(self.ig.independent_data[x],
                    self.ig.dependent_data[y], c='b')
 
-    def plot_model(self, proj, ax):
+    def plot_model(self, proj, ax, y_vals):
         """
         Plots the model proposed for the projection proj on ax.
+
+        :param y_vals: The component of the evaluated model belonging to the
+            dependent variable of proj.
         """
         x, y = proj
-        y_vals = getattr(self.ig._eval_model(), y.name)
         x_vals = self.ig._x_points[x]
         plot, = ax.plot(x_vals, y_vals, c='red')
         return plot
 
-    def update_plot(self, indep_var, dep_var):
+    def update_plot(self, indep_var, dep_var, y_vals):
         """
         Updates the plot of the proposed model.
+
+        :param y_vals: The component of the evaluated model belonging to
+            dep_var.
         """
-        evaluated_model = self.ig._eval_model()
         plot = self.ig._plots[(indep_var, dep_var)]
-        y_vals = getattr(evaluated_model, dep_var.name)
         x_vals = self.ig._x_points[indep_var]
         plot.set_data(x_vals, y_vals)
 
@@ -274,6 +423,28 @@ class StrategynD:
     """
     def __init__(self, interactive_guess):
         self.ig = interactive_guess
+        # Arrays reused for the statistics of every projection, see
+        # _plot_buffers.
+        self._buffers = {}
+
+    @cached_property
+    def _grid_rows(self):
+        """
+        Lookup table to group the points of the grid by the value of each of
+        the independent variables. Since the grid never changes, this is only
+        computed once.
+
+        :return: dict with independent variables as keys, and index arrays of
+            shape ``(n_points, n_points**(n_vars - 1))`` as values. Row ``i``
+            contains the indices of all grid points at the ``i``-th value in
+            ``_x_points``.
+        """
+        rows = {}
+        for var, x_vals in self.ig._x_grid.items():
+            n_points = len(self.ig._x_points[var])
+            order = np.argsort(x_vals, kind='mergesort')
+            rows[var] = order.reshape(n_points, -1)
+        return rows
 
     def plot_data(self, proj, ax):
         """
@@ -301,52 +472,91 @@ class StrategynD:
         ax.contourf(xx, yy, contour_grid.reshape(xx.shape),
                     50, vmin=vmin, cmap='Blues')
 
-    def plot_model(self, proj, ax):
+    def plot_model(self, proj, ax, y_vals):
         """
         Plots the model proposed for the projection proj on ax.
+
+        :param y_vals: The component of the evaluated model belonging to the
+            dependent variable of proj.
         """
         x, y = proj
-        evaluated_model = self.ig._eval_model()
-        y_vals = getattr(evaluated_model, y.name)
-        x_vals = self.ig._x_grid[x]
-        plot = ax.errorbar(x_vals, y_vals, xerr=0, yerr=0, c='red')
+        # Only create the artists here, with one point per value in
+        # _x_points. Their data is filled in by _set_plot_data, which is also
+        # used to update them in place afterwards.
+        x_plot_data = self.ig._x_points[x]
+        plot = ax.errorbar(x_plot_data, np.zeros_like(x_plot_data),
+                           xerr=0, yerr=0, c='red')
+        self._set_plot_data(plot, proj, y_vals)
         return plot
 
-    def update_plot(self, indep_var, dep_var):
+    def update_plot(self, indep_var, dep_var, y_vals):
         """
         Updates the plot of the proposed model.
+
+        :param y_vals: The component of the evaluated model belonging to
+            dep_var.
+        """
+        proj = (indep_var, dep_var)
+        self._set_plot_data(self.ig._plots[proj], proj, y_vals)
+
+    def _plot_buffers(self, proj):
+        """
+        The arrays in which the statistics of the projection proj are
+        computed. These have the same shape on every update, so they are only
+        allocated once per projection.
+
+        :return: tuple of arrays for the model values grouped per plotted
+            point, their means, their percentiles, and the segments of the
+            errorbars. The x-coordinates of the segments are already filled in.
+        """
+        try:
+            return self._buffers[proj]
+        except KeyError:
+            pass
+        x, y = proj
+        rows = self._grid_rows[x]
+        x_plot_data = self.ig._x_points[x]
+        n_points = len(x_plot_data)
+        n_percentiles = len(self.ig.percentile)
+        y_segments = np.empty((n_points, n_percentiles, 2))
+        y_segments[:, :, 0] = x_plot_data[:, np.newaxis]
+        buffers = (np.empty(rows.shape), np.empty(n_points),
+                   np.empty((n_percentiles, n_points)), y_segments)
+        self._buffers[proj] = buffers
+        return buffers
+
+    def _set_plot_data(self, plot, proj, y_vals):
+        """
+        Sets the data of the errorbar plot of the proposed model for the
+        projection proj.
+
+        :param plot: The container returned by ``ax.errorbar``.
+        :param proj: The projection (indep_var, dep_var) shown in plot.
+        :param y_vals: The component of the evaluated model to plot.
         """
-        evaluated_model = self.ig._eval_model()
-        y_vals = getattr(evaluated_model, dep_var.name)
+        indep_var = proj[0]
         x_vals = self.ig._x_grid[indep_var]
+        x_plot_data = self.ig._x_points[indep_var]
+        ys, y_plot_data, y_plot_error, y_segments = self._plot_buffers(proj)
 
-        x_plot_data = []
-        y_plot_data = []
-        y_plot_error = []
-        # TODO: Numpy magic
         # We need the error interval for every plotted point, so find all
         # the points plotted at x=x_i, and do some statistics on those.
         # Since all the points are on a grid made by meshgrid, the error
-        # in x will alwys be 0.
-        for x_val in self.ig._x_points[indep_var]:
-            # We get away with this instead of digitize because x_vals is
-            # on a grid made with meshgrid
-            idx_mask = x_vals == x_val
-            xs = x_vals[idx_mask]
-            x_plot_data.append(xs[0])
-            ys = y_vals[idx_mask]
-            y_plot_data.append(np.mean(ys))
-            y_error = np.percentile(ys, self.ig.percentile)
-            y_plot_error.append(y_error)
-
-        x_plot_data = np.array(x_plot_data)
-        y_plot_data = np.array(y_plot_data)
-        y_plot_error = np.array(y_plot_error)
-
-        xs = np.column_stack((x_plot_data, x_plot_data))
-        yerr = y_plot_error + y_plot_data[:, np.newaxis]
-        y_segments = np.dstack((xs, yerr))
-        plot_line, caps, error_lines = self.ig._plots[(indep_var, dep_var)]
+        # in x will alwys be 0, and the points at x=x_i can be looked up in
+        # the i-th row of _grid_rows. This way the statistics of all rows are
+        # computed at once.
+        # The grouped values are a private copy, so the percentiles may
+        # reorder them in place once the mean is known. The model output
+        # itself is cached by InteractiveGuess and must not be touched.
+        y_vals = np.broadcast_to(np.asarray(y_vals, dtype=ys.dtype),
+                                 x_vals.shape)
+        np.take(y_vals, self._grid_rows[indep_var], out=ys)
+        np.mean(ys, axis=1, out=y_plot_data)
+        np.percentile(ys, self.ig.percentile, axis=1, out=y_plot_error,
+                      overwrite_input=True)
+        np.add(y_plot_error.T, y_plot_data[:, np.newaxis],
+               out=y_segments[:, :, 1])
+        plot_line, caps, error_lines = plot
         plot_line.set_data(x_plot_data, y_plot_data)
         error_lines[1].set_segments(y_segments)
 
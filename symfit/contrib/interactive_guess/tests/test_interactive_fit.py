@@ -87,6 +87,44 @@ class Gaussian2DInteractiveGuessTest(unittest.TestCase):
         self.assertTrue(np.allclose(x_points, actual_x) and
                         np.allclose(true_y, actual_y))
 
+    def test_slider_callback_blit(self):
+        x = self.guess.model.independent_vars[0]
+        x_points = self.guess._x_points[x]
+        # Once drawn, slider events only redraw the animated artists
+        self.guess.fig.canvas.draw()
+        self.assertIsNotNone(self.guess._background)
+        new_k = 2000 * np.random.random()
+        self.guess._sliders[self.k].set_val(new_k)
+        try:
+            true_data = np_distr(x_points, new_k, self.x0.value)
+            plot = self.guess._plots[self.guess._projections[0]]
+            self.assertTrue(plot.get_animated())
+            self.assertTrue(np.allclose(true_data, plot.get_ydata()))
+        finally:
+            self.guess._sliders[self.k].reset()
+
+    def test_savefig_keeps_background(self):
+        import io
+        self.guess.fig.canvas.draw()
+        background = self.guess._background
+        buffer = io.BytesIO()
+        self.guess.fig.savefig(buffer, format='png',
+                               dpi=3 * self.guess.fig.dpi)
+        self.assertIs(self.guess._background, background)
+
+    def test_eval_cache(self):
+        first = self.guess._eval_model()
+        self.assertIs(self.guess._eval_model(), first)
+        self.guess._sliders[self.k].set_val(2 * self.k.value)
+        try:
+            self.assertIsNot(self.guess._eval_model(), first)
+        finally:
+            self.guess._sliders[self.k].reset()
+        # Returning to the previous position reuses the previous evaluation
+        self.assertIs(self.guess._eval_model(), first)
+        self.assertLessEqual(len(self.guess._eval_cache),
+                             self.guess._eval_cache_size)
+
     def test_number_of_projections(self):
         self.assertEqual(len(self.guess._projections), 1)
 
@@ -109,6 +147,88 @@ class Gaussian2DInteractiveGuessTest(unittest.TestCase):
             self.assertEqual(color, (1, 0, 0))
 
 
+class SliderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        x = Variable('x')
+        y = Variable('y')
+        # An initial value which is not a multiple of the slider steps.
+        a = Parameter('a', value=0.3, min=0, max=1)
+        cls.a = a
+
+        model = {y: a * x}
+        x_data = np.linspace(0, 1, 10)
+        y_data = 0.5 * x_data
+        cls.guess = interactive_guess.InteractiveGuess(model, x=x_data, y=y_data)
+
+    def test_initial_value(self):
+        slider = self.guess._sliders[self.a]
+        self.assertEqual(slider.val, 0.3)
+        self.assertEqual(self.a.value, 0.3)
+        slider.reset()
+        self.assertEqual(slider.val, 0.3)
+        self.assertEqual(self.a.value, 0.3)
+
+    def test_drag_quantized(self):
+        slider = self.guess._sliders[self.a]
+        step = (slider.valmax - slider.valmin) / self.guess._slider_steps
+        slider.drag_active = True
+        try:
+            # Dragging close to the initial value snaps back onto it.
+            slider.set_val(0.3 + 0.2 * step)
+            self.assertEqual(self.a.value, 0.3)
+            self.assertEqual(slider.val, 0.3)
+            slider.set_val(0.3 + 2.9 * step)
+            self.assertAlmostEqual(self.a.value, 0.3 + 3 * step)
+            self.assertEqual(slider.val, self.a.value)
+        finally:
+            slider.drag_active = False
+            slider.reset()
+
+
+class LargeGridTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        xs = [Variable('x{}'.format(i)) for i in range(4)]
+        z = Variable('z')
+        a = Parameter('a', value=1.0, min=0, max=2)
+        cls.a = a
+
+        model = {z: a * (xs[0] + xs[1] + xs[2] + xs[3])}
+        data = {x.name: np.random.random(100) for x in xs}
+        data['z'] = np.random.random(100)
+        # 30**4 grid points, so every evaluation takes 6.5 MB.
+        cls.guess = interactive_guess.InteractiveGuess(model, n_points=30,
+                                                       **data)
+
+    def test_eval_cache_nbytes(self):
+        slider = self.guess._sliders[self.a]
+        nbytes = self.guess._eval_model().z.nbytes
+        try:
+            for val in np.linspace(0.1, 1.9, 15):
+                slider.set_val(val)
+                self.assertLessEqual(self.guess._eval_cache_nbytes,
+                                     self.guess._eval_cache_max_nbytes)
+            self.assertLess(len(self.guess._eval_cache), 15)
+            self.assertEqual(self.guess._eval_cache_nbytes,
+                             nbytes * len(self.guess._eval_cache))
+        finally:
+            slider.reset()
+
+    def test_eval_too_large(self):
+        slider = self.guess._sliders[self.a]
+        self.guess._eval_cache_max_nbytes = 1000
+        try:
+            slider.set_val(0.5)
+            self.assertNotIn((0.5,), self.guess._eval_cache)
+            self.assertTrue(np.allclose(self.guess._eval_model().z,
+                                        0.5 * sum(self.guess._x_grid.values())))
+        finally:
+            del self.guess._eval_cache_max_nbytes
+            slider.reset()
+
+
 class VectorValuedTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -124,8 +244,25 @@ class VectorValuedTest(unittest.TestCase):
         y1_data = model[y1](x=x_data, k=1000, x0=1)
         y2_data = model[y2](x=x_data, k=1000, x0=1)
         cls.guess = interactive_guess.InteractiveGuess(model, x=x_data, y1=y1_data, y2=y2_data)
+        cls.k = k
+        cls.x0 = x0
 #        plt.close(cls.fit.fig)
 
+    def test_slider_callback_data(self):
+        x = self.guess.model.independent_vars[0]
+        x_points = self.guess._x_points[x]
+        new_k = 2000 * np.random.random()
+        self.guess._sliders[self.k].set_val(new_k)
+        try:
+            x0 = self.x0.value
+            y1_plot, y2_plot = [self.guess._plots[proj]
+                                for proj in self.guess._projections]
+            self.assertTrue(np.allclose(y1_plot.get_ydata(),
+                                        new_k * (x_points - x0)**2))
+            self.assertTrue(np.allclose(y2_plot.get_ydata(), x_points - x0))
+        finally:
+            self.guess._sliders[self.k].reset()
+
     def test_number_of_projections(self):
         self.assertEqual(len(self.guess._projections), 2)
 
@@ -181,6 +318,30 @@ class Gaussian3DInteractiveFitTest(unittest.TestCase):
     def test_number_of_plots(self):
         self.assertEqual(len(self.guess._plots), 2)
 
+    def test_projection_data(self):
+        evaluated_model = self.guess._eval_model()
+        for proj in self.guess._projections:
+            x, y = proj
+            plot_line, caps, error_lines = self.guess._plots[proj]
+            x_vals = self.guess._x_grid[x]
+            y_vals = getattr(evaluated_model, y.name)
+            # Every plotted point is the mean of all grid points at that x.
+            expected = [np.mean(y_vals[x_vals == x_val])
+                        for x_val in self.guess._x_points[x]]
+            self.assertTrue(np.allclose(plot_line.get_xdata(),
+                                        self.guess._x_points[x]))
+            self.assertTrue(np.allclose(plot_line.get_ydata(), expected))
+
+    def test_plot_size(self):
+        # The errorbars are drawn once per plotted point, not per grid point.
+        for proj in self.guess._projections:
+            x, y = proj
+            plot_line, caps, error_lines = self.guess._plots[proj]
+            n_points = len(self.guess._x_points[x])
+            self.assertEqual(len(plot_line.get_xdata()), n_points)
+            for lines in error_lines:
+                self.assertEqual(len(lines.get_segments()), n_points)
+
     def test_plot_titles(self):
         for proj in self.guess._projections:
             x, y = proj
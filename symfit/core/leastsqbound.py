@@ -352,13 +352,16 @@ def leastsqbound(func, x0, args=(), bounds=None, Dfun=None, full_output=0,
                              retval[1]['ipvt'] - 1)).T
         cov_x = None
         if info in [1, 2, 3, 4]:
-            from numpy.dual import inv
             from numpy.linalg import LinAlgError
+            from scipy.linalg import solve_triangular
             perm = take(eye(n), retval[1]['ipvt'] - 1, 0)
             r = triu(transpose(retval[1]['fjac'])[:n, :])
-            R = dot(r, perm)
+            # cov_x = inv(R^T R) with R = r perm. Rather than forming R^T R,
+            # which squares the condition number, invert the triangular
+            # factor r by back substitution: cov_x = R^-1 R^-T.
             try:
-                cov_x = inv(dot(transpose(R), R))
+                R_inv = dot(transpose(perm), solve_triangular(r, eye(n)))
+                cov_x = dot(R_inv, transpose(R_inv))
             except LinAlgError:
                 pass
         return (x, cov_x) + retval[1:-1] + (mesg, info)
@@ -26,6 +26,10 @@ class BaseObjective(object):
     """
     ABC for objective functions. Implements basic data handling.
     """
+    # Methods of the model whose most recent evaluation is remembered, see
+    # _eval_model.
+    _memoized_methods = ('__call__', 'eval_jacobian')
+
     def __init__(self, model, data):
         """
         :param model: `symfit` style model.
@@ -33,9 +37,22 @@ class BaseObjective(object):
         """
         self.model = model
         self.data = data
+        # Most recent evaluation of the model per method, see _eval_model.
+        self._model_cache = {}
         # Compares the model with the data to see if they are compatible.
         self._sanity_checking()
 
+    def __getstate__(self):
+        # The remembered model evaluations can be large, and are of no use
+        # after unpickling, so don't pickle them.
+        state = self.__dict__.copy()
+        state.pop('_model_cache', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._model_cache = {}
+
     @cached_property
     def dependent_data(self):
         """
@@ -84,16 +101,56 @@ class BaseObjective(object):
         :param parameters: parameters as keyword arguments.
         :return: evaluated model.
         """
-        # zip will stop when the shortest of the two is exhausted
-        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
-        parameters.update(self._invariant_kwargs)
-        result = self.model(**key2str(parameters))._asdict()
+        result = self._eval_model('__call__', ordered_parameters, parameters)
         # Return only the components corresponding to the dependent data.
         return self._shape_of_dependent_data(
             [comp for var, comp in result.items()
              if var in self.model.dependent_vars]
         )
 
+    def _eval_model(self, method, ordered_parameters, parameters):
+        """
+        Evaluate ``method`` of ``self.model`` for the given parameters.
+
+        Minimizers typically ask for the value and the jacobian of the
+        objective at the same point, both of which need the model evaluated at
+        that point. Therefore the most recent evaluation of the methods in
+        ``_memoized_methods`` is remembered, and reused if the parameters did
+        not change. The hessian is typically evaluated only once per point,
+        and is by far the largest, so it is never remembered.
+
+        :param method: name of the method of ``self.model`` to call, e.g.
+            ``'__call__'`` or ``'eval_jacobian'``.
+        :param ordered_parameters: List of parameter, in alphabetical order.
+        :param parameters: parameters as keyword arguments.
+        :return: the output of the model as a dict.
+        """
+        # zip will stop when the shortest of the two is exhausted
+        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
+        parameters.update(self._invariant_kwargs)
+        kwargs = key2str(parameters)
+        if method not in self._memoized_methods:
+            return getattr(self.model, method)(**kwargs)._asdict()
+        # The invariant kwargs never change, so only the rest is compared. By
+        # keying on the raw bytes of the values, comparing two keys is a
+        # single tuple comparison.
+        key = []
+        for name in sorted(kwargs):
+            if name not in self._invariant_names:
+                value = np.asarray(kwargs[name])
+                key.append((name, value.dtype.str, value.shape, value.tobytes()))
+        key = tuple(key)
+        try:
+            cached_key, result = self._model_cache[method]
+        except KeyError:
+            pass
+        else:
+            if key == cached_key:
+                return result
+        result = getattr(self.model, method)(**kwargs)._asdict()
+        self._model_cache[method] = (key, result)
+        return result
+
     def _shape_of_dependent_data(self, model_output, param_level=0):
         """
         In rare cases, the dependent data and the output of the model do not
@@ -142,6 +199,13 @@ class BaseObjective(object):
         )
         return kwargs
 
+    @cached_property
+    def _invariant_names(self):
+        """
+        :return: The names of the arguments in ``_invariant_kwargs``.
+        """
+        return set(key2str(self._invariant_kwargs))
+
     def __eq__(self, other):
         """
         Objectives are considered equal if they are of the same type, have the
@@ -192,9 +256,7 @@ class GradientObjective(BaseObjective):
         :param parameters: parameters as keyword arguments.
         :return: evaluated jacobian
         """
-        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
-        parameters.update(self._invariant_kwargs)
-        result = self.model.eval_jacobian(**key2str(parameters))._asdict()
+        result = self._eval_model('eval_jacobian', ordered_parameters, parameters)
         # Return only the components corresponding to the dependent data.
         return self._shape_of_dependent_data(
             [comp for var, comp in result.items()
@@ -218,9 +280,7 @@ class HessianObjective(GradientObjective):
         :param parameters: parameters as keyword arguments.
         :return: evaluated hessian
         """
-        parameters.update(dict(zip(self.model.free_params, ordered_parameters)))
-        parameters.update(self._invariant_kwargs)
-        result = self.model.eval_hessian(**key2str(parameters))._asdict()
+        result = self._eval_model('eval_hessian', ordered_parameters, parameters)
         # Return only the components corresponding to the dependent data.
         return self._shape_of_dependent_data(
             [comp for var, comp in result.items()
@@ -296,6 +356,22 @@ class LeastSquares(HessianObjective):
     have to have the same shape. The only thing that matters is that within each
     component the shapes have to be compatible.
     """
+    @cached_property
+    def _weights(self):
+        """
+        The weights :math:`1 / \\sigma_i(x_i)^2` of every component with
+        dependent data. These only depend on the data, so they are computed
+        once instead of on every call made by the minimizer.
+
+        :return: dict with dependent variables as keys, weights as values.
+        :rtype: collections.OrderedDict
+        """
+        return OrderedDict(
+            (var, 1 / self.sigma_data[self.model.sigmas[var]] ** 2)
+            for var, dep_data in self.dependent_data.items()
+            if dep_data is not None
+        )
+
     @keywordonly(flatten_components=True)
     def __call__(self, ordered_parameters=[], **parameters):
         """
@@ -316,9 +392,9 @@ class LeastSquares(HessianObjective):
         for index, (dep_var, dep_var_value) in enumerate(zip(self.model.dependent_vars, evaluated_func)):
             dep_data = self.dependent_data.get(dep_var, None)
             if dep_data is not None:
-                sigma = self.sigma_data[self.model.sigmas[dep_var]]
+                weights = self._weights[dep_var]
                 chi2[index] += np.sum(
-                    (dep_var_value - dep_data) ** 2 / sigma ** 2
+                    (dep_var_value - dep_data) ** 2 * weights
                 )
         chi2 = np.sum(chi2) if flatten_components else chi2
         return chi2 / 2
@@ -343,10 +419,9 @@ class LeastSquares(HessianObjective):
         for var, f, jac_comp in zip(self.model.dependent_vars, evaluated_func,
                                     evaluated_jac):
             y = self.dependent_data.get(var, None)
-            sigma_var = self.model.sigmas[var]
             if y is not None:
-                sigma = self.sigma_data[sigma_var]
-                pre_sum = jac_comp * ((y - f) / sigma**2)[np.newaxis, ...]
+                weights = self._weights[var]
+                pre_sum = jac_comp * ((y - f) * weights)[np.newaxis, ...]
                 axes = tuple(range(1, len(pre_sum.shape)))
                 result -= np.sum(pre_sum, axis=axes, keepdims=False)
         return np.atleast_1d(np.squeeze(np.array(result)))
@@ -375,18 +450,43 @@ class LeastSquares(HessianObjective):
                                                evaluated_func, evaluated_jac,
                                                evaluated_hess):
             y = self.dependent_data.get(var, None)
-            sigma_var = self.model.sigmas[var]
             if y is not None:
-                sigma = self.sigma_data[sigma_var]
-                p1 = hess_comp * ((y - f) / sigma**2)[np.newaxis, np.newaxis, ...]
-                # Outer product
-                p2 = np.einsum('i...,j...->ij...', jac_comp, jac_comp)
-                p2 = p2 / sigma[np.newaxis, np.newaxis, ...]**2
-                # We sum away everything except the matrices in the axes 0 & 1.
-                axes = tuple(range(2, len(p2.shape)))
-                result += np.sum(p2 - p1, axis=axes, keepdims=False)
+                weights = self._weights[var]
+                # We sum away everything except the matrices in the axes 0 & 1,
+                # as matrix products over the flattened data axes. This avoids
+                # storing the outer product of the jacobian per data point.
+                hess_comp, res = self._flatten_data_axes(
+                    hess_comp, (y - f) * weights, param_level=2
+                )
+                jac_comp, weights = self._flatten_data_axes(
+                    jac_comp, weights, param_level=1
+                )
+                p1 = hess_comp.dot(res)
+                p2 = (jac_comp * weights).dot(jac_comp.T)
+                result += p2 - p1
         return np.atleast_2d(np.squeeze(np.array(result)))
 
+    @staticmethod
+    def _flatten_data_axes(component, data, param_level):
+        """
+        Broadcast the data axes of a component of the jacobian or hessian of
+        the model against ``data``, and flatten them into a single axis.
+
+        :param component: evaluated jacobian or hessian of a component.
+        :param data: array with the shape of (a component of) the data.
+        :param param_level: number of leading parameter axes of ``component``.
+        :return: tuple of ``component`` with shape
+            ``param_shape + (n_data_points,)``, and ``data`` with shape
+            ``(n_data_points,)``.
+        """
+        param_shape = component.shape[:param_level]
+        data_shape = np.broadcast(
+            np.broadcast_to(0, component.shape[param_level:]), data
+        ).shape
+        component = np.broadcast_to(component, param_shape + data_shape)
+        data = np.broadcast_to(data, data_shape)
+        return component.reshape(param_shape + (-1,)), data.reshape(-1)
+
 
 class HessianObjectiveJacApprox(HessianObjective):
     """
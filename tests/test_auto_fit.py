@@ -1,6 +1,7 @@
 from __future__ import division, print_function
 import pytest
 import numpy as np
+import scipy.stats
 from symfit import (
     variables, parameters, Fit, Parameter, Variable,
     Equality, Model, GradientModel
@@ -221,6 +222,28 @@ def test_global_fitting():
     assert isinstance(fit.minimizer, BFGS)
 
 
+def binned_gaussian_2d(mean, cov, n_samples, bins=100):
+    """
+    Counts of ``n_samples`` draws from a 2D gaussian with diagonal covariance
+    ``cov``, binned on a ``bins`` by ``bins`` grid on the unit square. Rather
+    than drawing the samples and binning them, the number of samples in every
+    bin is drawn directly from a Poisson distribution.
+
+    :return: the counts with shape ``(bins, bins)``, and the x and y coordinates
+        of the centres of the bins in the same shape.
+    """
+    edges = np.linspace(0.0, 1.0, bins + 1)
+    # x and y are independent, so the probability of every bin is the product
+    # of the probabilities of the bin along x and along y.
+    px = np.diff(scipy.stats.norm.cdf(edges, mean[0], np.sqrt(cov[0][0])))
+    py = np.diff(scipy.stats.norm.cdf(edges, mean[1], np.sqrt(cov[1][1])))
+    counts = np.random.poisson(n_samples * np.outer(px, py)).astype(float)
+
+    centres = (edges[:-1] + edges[1:]) / 2
+    xx, yy = np.meshgrid(centres, centres, sparse=False, indexing='ij')
+    return counts, xx, yy
+
+
 def test_gaussian_2d_fitting():
     """
     Tests fitting to a scalar gaussian function with 2 independent
@@ -229,19 +252,8 @@ def test_gaussian_2d_fitting():
     mean = (0.6, 0.4)  # x, y mean 0.6, 0.4
     cov = [[0.2**2, 0], [0, 0.1**2]]
 
-    # TODO: Since we bin this data later on in a 100 bins, just evaluate 100
-    #       points on a Gaussian, and add an appropriate amount of noise. This
-    #       burns CPU cycles without good reason.
-    data = np.random.multivariate_normal(mean, cov, 1000000)
-
-    # Insert them as y,x here as np fucks up cartesian conventions.
-    ydata, xedges, yedges = np.histogram2d(data[:, 0], data[:, 1], bins=100,
-                                           range=[[0.0, 1.0], [0.0, 1.0]])
-    xcentres = (xedges[:-1] + xedges[1:]) / 2
-    ycentres = (yedges[:-1] + yedges[1:]) / 2
-
-    # Make a valid grid to match ydata
-    xx, yy = np.meshgrid(xcentres, ycentres, sparse=False, indexing='ij')
+    np.random.seed(0)
+    ydata, xx, yy = binned_gaussian_2d(mean, cov, 1000000)
 
     x0 = Parameter(value=mean[0], min=0.0, max=1.0)
     sig_x = Parameter(value=0.2, min=0.0, max=0.3)
@@ -257,10 +269,10 @@ def test_gaussian_2d_fitting():
     fit = Fit(model, x=xx, y=yy, g=ydata)
     fit_result = fit.execute()
 
-    assert fit_result.value(x0) == pytest.approx(np.mean(data[:, 0]), 1e-3)
-    assert fit_result.value(y0) == pytest.approx(np.mean(data[:, 1]), 1e-3)
-    assert np.abs(fit_result.value(sig_x)) == pytest.approx(np.std(data[:, 0]), 1e-2)
-    assert np.abs(fit_result.value(sig_y)) == pytest.approx(np.std(data[:, 1]), 1e-2)
+    assert fit_result.value(x0) == pytest.approx(mean[0], 1e-3)
+    assert fit_result.value(y0) == pytest.approx(mean[1], 1e-3)
+    assert np.abs(fit_result.value(sig_x)) == pytest.approx(np.sqrt(cov[0][0]), 1e-2)
+    assert np.abs(fit_result.value(sig_y)) == pytest.approx(np.sqrt(cov[1][1]), 1e-2)
     assert fit_result.r_squared >= 0.96
 
 
@@ -273,21 +285,10 @@ def test_gaussian_2d_fitting_background():
     cov = [[0.2**2, 0], [0, 0.1**2]]
     background = 3.0
 
-    # TODO: Since we bin this data later on in a 100 bins, just evaluate 100
-    #       points on a Gaussian, and add an appropriate amount of noise. This
-    #       burns CPU cycles without good reason.
-    data = np.random.multivariate_normal(mean, cov, 500000)
-    # print(data.shape)
-    # Insert them as y,x here as np fucks up cartesian conventions.
-    ydata, xedges, yedges = np.histogram2d(data[:, 0], data[:, 1], bins=100,
-                                           range=[[0.0, 1.0], [0.0, 1.0]])
-    xcentres = (xedges[:-1] + xedges[1:]) / 2
-    ycentres = (yedges[:-1] + yedges[1:]) / 2
+    np.random.seed(0)
+    ydata, xx, yy = binned_gaussian_2d(mean, cov, 500000)
     ydata += background  # Background
 
-    # Make a valid grid to match ydata
-    xx, yy = np.meshgrid(xcentres, ycentres, sparse=False, indexing='ij')
-
     x0 = Parameter(value=1.1 * mean[0], min=0.0, max=1.0)
     sig_x = Parameter(value=1.1 * 0.2, min=0.0, max=0.3)
     y0 = Parameter(value=1.1 * mean[1], min=0.0, max=1.0)
@@ -304,9 +305,9 @@ def test_gaussian_2d_fitting_background():
     fit = Fit(model, x=xx, y=yy, g=ydata)
     fit_result = fit.execute()
 
-    assert fit_result.value(x0) / np.mean(data[:, 0]) == pytest.approx(1.0, 1e-2)
-    assert fit_result.value(y0) / np.mean(data[:, 1]) == pytest.approx(1.0, 1e-2)
-    assert np.abs(fit_result.value(sig_x)) / np.std(data[:, 0]) == pytest.approx(1.0, 1e-2)
-    assert np.abs(fit_result.value(sig_y)) / np.std(data[:, 1]) == pytest.approx(1.0, 1e-2)
+    assert fit_result.value(x0) / mean[0] == pytest.approx(1.0, 1e-2)
+    assert fit_result.value(y0) / mean[1] == pytest.approx(1.0, 1e-2)
+    assert np.abs(fit_result.value(sig_x)) / np.sqrt(cov[0][0]) == pytest.approx(1.0, 1e-2)
+    assert np.abs(fit_result.value(sig_y)) / np.sqrt(cov[1][1]) == pytest.approx(1.0, 1e-2)
     assert background / fit_result.value(b) == pytest.approx(1.0, 1e-1)
     assert fit_result.r_squared >= 0.96
@@ -200,6 +200,29 @@ def test_jac_hess():
     assert fit_result.value(b) == pytest.approx(1.0)
 
 
+def test_leastsqbound_covariance():
+    """
+    Without bounds, the covariance matrix found by leastsqbound should be the
+    inverse of J^T J, just like for scipy's leastsq.
+    """
+    from scipy.optimize import leastsq
+    from symfit.core.leastsqbound import leastsqbound
+
+    xdata = np.linspace(0, 10, 25)
+    ydata = 3.0 * xdata ** 2 - 2.0 * xdata + 1.0 + np.sin(5 * xdata)
+    A = np.column_stack((xdata ** 2, xdata, np.ones_like(xdata)))
+
+    def residuals(p):
+        return A.dot(p) - ydata
+
+    x0 = np.array([1.0, 1.0, 1.0])
+    x, cov_x = leastsqbound(residuals, x0, full_output=True)[:2]
+    x_scipy, cov_scipy = leastsq(residuals, x0, full_output=True)[:2]
+    assert x == pytest.approx(x_scipy)
+    assert cov_x == pytest.approx(cov_scipy)
+    assert cov_x == pytest.approx(np.linalg.inv(A.T.dot(A)))
+
+
 def test_pickle():
     """
     Test the picklability of the different minimizers.
@@ -7,7 +7,7 @@ import numpy as np
 from symfit import (
     Variable, Parameter, parameters, Fit,
     Model, FitResults, variables, Idx,
-    symbols, Sum, log, exp, cos, pi, besseli
+    symbols, Sum, log, exp, cos, pi, besseli, CallableNumericalModel
 )
 from symfit.core.objectives import (
     VectorLeastSquares, LeastSquares, LogLikelihood, MinimizeModel,
@@ -262,3 +262,78 @@ def test_LogLikelihood_global():
     assert eval_numerical.shape == tuple()  # Empty tuple -> scalar
     assert jac_numerical.shape == (3,)
     assert hess_numerical.shape == (3, 3,)
+
+
+def test_LeastSquares_weights():
+    """
+    The weights of LeastSquares only depend on the data, so they should be
+    computed once and agree with the provided sigma's.
+    """
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    model = Model({y: a * x + b})
+    xdata = np.linspace(0, 10, 10)
+    ydata = 2 * xdata + 3
+    sigma = np.linspace(0.5, 2, 10)
+
+    chi2 = LeastSquares(model, data={x: xdata, y: ydata,
+                                     model.sigmas[y]: sigma})
+    assert chi2._weights is chi2._weights
+    assert chi2._weights[y] == pytest.approx(1 / sigma ** 2)
+    assert chi2(x=xdata, a=1, b=3) == pytest.approx(
+        0.5 * np.sum((xdata / sigma) ** 2)
+    )
+
+
+def test_model_evaluation_reuse():
+    """
+    Minimizers ask for the value and the jacobian of the objective at the same
+    point, so the model should only be evaluated once per point.
+    """
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    calls = []
+
+    def f(x, a, b):
+        calls.append((a, b))
+        return a * x + b
+
+    model = CallableNumericalModel({y: f}, connectivity_mapping={y: {x, a, b}})
+    xdata = np.linspace(0, 10, 10)
+    chi2 = LeastSquares(model, data={x: xdata, y: 2 * xdata + 3,
+                                     model.sigmas[y]: np.ones_like(xdata)})
+
+    assert chi2([1, 3]) == pytest.approx(0.5 * np.sum(xdata ** 2))
+    assert len(calls) == 1
+    chi2([1, 3])
+    assert len(calls) == 1
+    # A new point requires a new evaluation
+    assert chi2([2, 3]) == pytest.approx(0)
+    assert len(calls) == 2
+    assert chi2(a=1, b=3) == pytest.approx(0.5 * np.sum(xdata ** 2))
+    assert len(calls) == 3
+
+
+def test_model_cache_state():
+    """
+    Only the value and jacobian of the model are remembered, and the
+    remembered evaluations are not part of the pickled state.
+    """
+    x, y = variables('x, y')
+    a, b = parameters('a, b')
+    model = Model({y: a * x + b})
+    xdata = np.linspace(0, 10, 10)
+    chi2 = LeastSquares(model, data={x: xdata, y: 2 * xdata + 3,
+                                     model.sigmas[y]: np.ones_like(xdata)})
+    chi2([1, 3])
+    chi2.eval_jacobian([1, 3])
+    chi2.eval_hessian([1, 3])
+    assert set(chi2._model_cache) == {'__call__', 'eval_jacobian'}
+
+    state = chi2.__getstate__()
+    assert '_model_cache' not in state
+    assert '_model_cache' in chi2.__dict__
+    new_chi2 = LeastSquares.__new__(LeastSquares)
+    new_chi2.__setstate__(state)
+    assert new_chi2._model_cache == {}
+    assert new_chi2([1, 3]) == pytest.approx(chi2([1, 3]))